@@ -2,69 +2,145 @@
 #
 # SPDX short identifier: ADIBSD
 
-from typing import Dict, List
-
+import re
+import sys
+import time
+from collections import defaultdict
+from copy import deepcopy
+from functools import lru_cache
+from itertools import chain, groupby
+from typing import Dict, List, Tuple
+
+from adi.attribute import attribute, get_numbers
 from adi.context_manager import context_manager
 from adi.rx_tx import rx_tx
 from adi.sync_start import sync_start
 
 
 def _map_to_dict(paths, ch):
-    fddc, cddc, adc = ch.attrs["label"].value.split("->")
-    if adc not in paths.keys():
-        paths[adc] = {}
-    if cddc not in paths[adc].keys():
-        paths[adc][cddc] = {}
-    if fddc not in paths[adc][cddc].keys():
-        paths[adc][cddc][fddc] = {"channels": [ch._id]}
-    else:
-        paths[adc][cddc][fddc]["channels"].append(ch._id)
+    # Interned so the repeated key lookups compare by identity
+    fddc, cddc, adc = map(sys.intern, ch.attrs["label"].value.split("->", 2))
+    paths[adc][cddc][fddc]["channels"].append(sys.intern(ch._id))
     return paths
 
 
-def _sortconv(chans_names, noq=False, dds=False):
-    tmpI = filter(lambda k: "_i" in k, chans_names)
-    tmpQ = filter(lambda k: "_q" in k, chans_names)
-
-    def ignoreadc(w):
-        return int(w[len("voltage") : w.find("_")])
-
-    def ignorealt(w):
-        return int(w[len("altvoltage") :])
-
-    chans_names_out = []
+@lru_cache(maxsize=None)
+def _sortconv_cached(chans_names, noq, dds):
     if dds:
-        filt = ignorealt
-        tmpI = chans_names
-        noq = True
-    else:
-        filt = ignoreadc
+        keyed = [(int(n[len("altvoltage") :]), n) for n in chans_names]
+        return tuple(n for _, n in sorted(keyed))
+
+    tmpI, tmpQ = [], []
+    for n in chans_names:
+        if n.endswith("_i"):
+            tmpI.append((int(n[len("voltage") : -len("_i")]), n))
+        elif n.endswith("_q"):
+            tmpQ.append((int(n[len("voltage") : -len("_q")]), n))
+    tmpI = [n for _, n in sorted(tmpI)]
+    if noq:
+        return tuple(tmpI)
+    tmpQ = [n for _, n in sorted(tmpQ)]
+    return tuple(chain.from_iterable(zip(tmpI, tmpQ)))
 
-    tmpI = sorted(tmpI, key=filt)
-    tmpQ = sorted(tmpQ, key=filt)
-    for i in range(len(tmpI)):
-        chans_names_out.append(tmpI[i])
-        if not noq:
-            chans_names_out.append(tmpQ[i])
 
-    return chans_names_out
+def _sortconv(chans_names, noq=False, dds=False):
+    return list(_sortconv_cached(tuple(chans_names), noq, dds))
+
+
+def _build_layout(rxadc, txdac):
+    # Get DDC and DUC mappings
+    paths = defaultdict(
+        lambda: defaultdict(lambda: defaultdict(lambda: {"channels": []}))
+    )
+
+    for ch in rxadc.channels:
+        if "label" in ch.attrs:
+            paths = _map_to_dict(paths, ch)
+    paths = {
+        adc: {cddc: dict(fddcs) for cddc, fddcs in cddcs.items()}
+        for adc, cddcs in paths.items()
+    }
+    # Read-only flat view of the map as (converter, cdc, fdc, channels) records
+    path_map_flat = tuple(
+        (adc, cddc, fddc, tuple(paths[adc][cddc][fddc]["channels"]))
+        for adc in paths
+        for cddc in paths[adc]
+        for fddc in paths[adc][cddc]
+    )
+
+    # Get data + DDS channels
+    rx_channel_names = []
+    tx_channel_names = []
+    dds_channel_names = []
+    for ch in rxadc.channels:
+        if ch.scan_element and not ch.output:
+            rx_channel_names.append(ch._id)
+    for ch in txdac.channels:
+        if ch.scan_element:
+            tx_channel_names.append(ch._id)
+        else:
+            dds_channel_names.append(ch._id)
+
+    # Sort channel names
+    rx_channel_names = _sortconv(rx_channel_names)
+    tx_channel_names = _sortconv(tx_channel_names)
+    dds_channel_names = _sortconv(dds_channel_names, dds=True)
+
+    # Map unique attributes to channel properties
+    rx_fine_ddc_channel_names = []
+    rx_coarse_ddc_channel_names = []
+    tx_fine_duc_channel_names = []
+    tx_coarse_duc_channel_names = []
+    for (converter, _), group in groupby(path_map_flat, key=lambda p: p[:2]):
+        channels = [name for p in group for name in p[3] if name.endswith("_i")]
+        if "ADC" in converter:
+            rx_coarse_ddc_channel_names.append(channels[0])
+            rx_fine_ddc_channel_names += channels
+        else:
+            tx_coarse_duc_channel_names.append(channels[0])
+            tx_fine_duc_channel_names += channels
+
+    return (
+        paths,
+        path_map_flat,
+        rx_channel_names,
+        tx_channel_names,
+        dds_channel_names,
+        rx_fine_ddc_channel_names,
+        rx_coarse_ddc_channel_names,
+        tx_fine_duc_channel_names,
+        tx_coarse_duc_channel_names,
+    )
+
+
+# Attribute values that are a single number and nothing else
+_number = re.compile(r"\s*[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?\s*")
+
+# Channel layouts keyed on the IIO context XML
+_layout_cache: Dict[str, tuple] = {}
 
 
 class ad9081(rx_tx, context_manager, sync_start):
     """AD9081 Mixed-Signal Front End (MxFE)"""
 
     _complex_data = True
-    _rx_channel_names: List[str] = []
-    _tx_channel_names: List[str] = []
-    _tx_control_channel_names: List[str] = []
-    _rx_coarse_ddc_channel_names: List[str] = []
-    _tx_coarse_duc_channel_names: List[str] = []
-    _rx_fine_ddc_channel_names: List[str] = []
-    _tx_fine_duc_channel_names: List[str] = []
-    _dds_channel_names: List[str] = []
+    # Channel name lists are assigned per instance in __init__. Before that,
+    # _rx/_tx_channel_names still resolve to the shared rx_core/tx_core lists
+    _rx_channel_names: List[str]
+    _tx_channel_names: List[str]
+    _tx_control_channel_names: List[str]
+    _rx_coarse_ddc_channel_names: List[str]
+    _tx_coarse_duc_channel_names: List[str]
+    _rx_fine_ddc_channel_names: List[str]
+    _tx_fine_duc_channel_names: List[str]
+    _dds_channel_names: List[str]
     _device_name = ""
 
-    _path_map: Dict[str, Dict[str, Dict[str, List[str]]]] = {}
+    _path_map: Dict[str, Dict[str, Dict[str, List[str]]]]
+    _path_map_flat: Tuple[Tuple[str, str, str, Tuple[str, ...]], ...]
+
+    # Seconds that reads of clock and rate attributes are reused for
+    _attr_cache_ttl = 5.0
 
     def __init__(self, uri=""):
 
@@ -77,6 +153,8 @@ class ad9081(rx_tx, context_manager, sync_start):
         self._rx_fine_ddc_channel_names = []
         self._tx_fine_duc_channel_names = []
         self._dds_channel_names = []
+        self._channel_cache = {}
+        self._attr_cache = {}
 
         context_manager.__init__(self, uri, self._device_name)
         # Default device for attribute writes
@@ -85,51 +163,86 @@ class ad9081(rx_tx, context_manager, sync_start):
         self._rxadc = self._ctx.find_device("axi-ad9081-rx-hpc")
         self._txdac = self._ctx.find_device("axi-ad9081-tx-hpc")
 
-        # Get DDC and DUC mappings
-        paths = {}
-
-        for ch in self._rxadc.channels:
-            if "label" in ch.attrs:
-                paths = _map_to_dict(paths, ch)
-        self._path_map = paths
-
-        # Get data + DDS channels
-        for ch in self._rxadc.channels:
-            if ch.scan_element and not ch.output:
-                self._rx_channel_names.append(ch._id)
-        for ch in self._txdac.channels:
-            if ch.scan_element:
-                self._tx_channel_names.append(ch._id)
-            else:
-                self._dds_channel_names.append(ch._id)
-
-        # Sort channel names
-        self._rx_channel_names = _sortconv(self._rx_channel_names)
-        self._tx_channel_names = _sortconv(self._tx_channel_names)
-        self._dds_channel_names = _sortconv(self._dds_channel_names, dds=True)
-
-        # Map unique attributes to channel properties
-        self._rx_fine_ddc_channel_names = []
-        self._rx_coarse_ddc_channel_names = []
-        self._tx_fine_duc_channel_names = []
-        self._tx_coarse_duc_channel_names = []
-        for converter in paths:
-            for cdc in paths[converter]:
-                channels = []
-                for fdc in paths[converter][cdc]:
-                    channels += paths[converter][cdc][fdc]["channels"]
-                channels = [name for name in channels if "_i" in name]
-                if "ADC" in converter:
-                    self._rx_coarse_ddc_channel_names.append(channels[0])
-                    self._rx_fine_ddc_channel_names += channels
-                else:
-                    self._tx_coarse_duc_channel_names.append(channels[0])
-                    self._tx_fine_duc_channel_names += channels
+        # Channel layout only depends on the context, so it is built once
+        # per context description and copied into each instance
+        key = self._ctx.xml
+        if key not in _layout_cache:
+            _layout_cache[key] = _build_layout(self._rxadc, self._txdac)
+        (
+            self._path_map,
+            self._path_map_flat,
+            self._rx_channel_names,
+            self._tx_channel_names,
+            self._dds_channel_names,
+            self._rx_fine_ddc_channel_names,
+            self._rx_coarse_ddc_channel_names,
+            self._tx_fine_duc_channel_names,
+            self._tx_coarse_duc_channel_names,
+        ) = deepcopy(_layout_cache[key])
+
+        # Resolve control channels up front so property accesses never
+        # have to search the device channel list
+        self._v0i_rx = self._find_channel("voltage0_i", False)
+        self._find_channel("voltage0_i", True)
+        for name in self._rx_fine_ddc_channel_names:
+            self._find_channel(name, False)
+        for name in self._tx_fine_duc_channel_names:
+            self._find_channel(name, True)
 
         rx_tx.__init__(self)
         sync_start.__init__(self)
         self.rx_buffer_size = 2 ** 16
 
+    def _find_channel(self, channel_name, output, _ctrl=None):
+        """Find channel once per device and reuse the handle on later accesses"""
+        _ctrl = _ctrl or self._ctrl
+        key = (_ctrl.id, channel_name, output)
+        channel = self._channel_cache.get(key)
+        if channel is None:
+            channel = _ctrl.find_channel(channel_name, output)
+            if not channel:
+                raise Exception("No channel found with name: " + channel_name)
+            self._channel_cache[key] = channel
+        return channel
+
+    def _get_iio_attr_str(self, channel_name, attr_name, output, _ctrl=None):
+        """ Get channel attribute as string """
+        channel = self._find_channel(channel_name, output, _ctrl)
+        return channel.attrs[attr_name].value
+
+    def _set_iio_attr(self, channel_name, attr_name, output, value, _ctrl=None):
+        """ Set channel attribute """
+        self._attr_cache.clear()
+        channel = self._find_channel(channel_name, output, _ctrl)
+        channel.attrs[attr_name].value = str(value)
+
+    def _set_iio_dev_attr(self, attr_name, value, _ctrl=None):
+        """ Set device attribute """
+        self._attr_cache.clear()
+        attribute._set_iio_dev_attr(self, attr_name, value, _ctrl)
+
+    def _set_iio_dev_attr_str(self, attr_name, value, _ctrl=None):
+        """ Set device attribute with string """
+        self._attr_cache.clear()
+        attribute._set_iio_dev_attr_str(self, attr_name, value, _ctrl)
+
+    def _set_iio_debug_attr_str(self, attr_name, value, _ctrl=None):
+        """ Set debug attribute with string """
+        self._attr_cache.clear()
+        attribute._set_iio_debug_attr_str(self, attr_name, value, _ctrl)
+
+    def _get_iio_attr_single_cached(self, channel_name, attr, output):
+        """Read an attribute that rarely changes, reusing recent reads.
+        Any attribute write drops the cached values.
+        """
+        key = (channel_name, attr, output)
+        now = time.monotonic()
+        entry = self._attr_cache.get(key)
+        if entry is None or now - entry[0] >= self._attr_cache_ttl:
+            entry = (now, self._get_iio_attr_single(channel_name, attr, output))
+            self._attr_cache[key] = entry
+        return entry[1]
+
     def _get_iio_attr_str_single(self, channel_name, attr, output):
         # This is overridden by subclasses
         return self._get_iio_attr_str(channel_name, attr, output)
@@ -617,22 +730,43 @@ class ad9081(rx_tx, context_manager, sync_start):
     @property
     def rx_sample_rate(self):
         """rx_sampling_frequency: Sample rate after decimation"""
-        return self._get_iio_attr_single("voltage0_i", "sampling_frequency", False)
+        return self._get_iio_attr_single_cached(
+            "voltage0_i", "sampling_frequency", False
+        )
 
     @property
     def adc_frequency(self):
         """adc_frequency: ADC frequency in Hz"""
-        return self._get_iio_attr_single("voltage0_i", "adc_frequency", False)
+        return self._get_iio_attr_single_cached("voltage0_i", "adc_frequency", False)
 
     @property
     def tx_sample_rate(self):
         """tx_sampling_frequency: Sample rate before interpolation"""
-        return self._get_iio_attr_single("voltage0_i", "sampling_frequency", True)
+        return self._get_iio_attr_single_cached(
+            "voltage0_i", "sampling_frequency", True
+        )
 
     @property
     def dac_frequency(self):
         """dac_frequency: DAC frequency in Hz"""
-        return self._get_iio_attr_single("voltage0_i", "dac_frequency", True)
+        return self._get_iio_attr_single_cached("voltage0_i", "dac_frequency", True)
+
+    def rx_voltage0_snapshot(self):
+        """rx_voltage0_snapshot: Read every voltage0_i receive attribute in one pass
+
+        returns: type=dict
+            Attribute names mapped to their value as a number when the whole
+            value is numeric, otherwise as the raw string. Attributes that
+            cannot be read are left out.
+        """
+        out = {}
+        for name, attr in self._v0i_rx.attrs.items():
+            try:
+                value = attr.value
+            except OSError:
+                continue
+            out[name] = get_numbers(value) if _number.fullmatch(value) else value
+        return out
 
     @property
     def jesd204_fsm_ctrl(self):
@@ -86,17 +86,17 @@ class ad9081_mc(ad9081):
     """
 
     _complex_data = True
-    _rx_channel_names: List[str] = []
-    _tx_channel_names: List[str] = []
-    _tx_control_channel_names: List[str] = []
-    _rx_coarse_ddc_channel_names: List[str] = []
-    _tx_coarse_duc_channel_names: List[str] = []
-    _rx_fine_ddc_channel_names: List[str] = []
-    _tx_fine_duc_channel_names: List[str] = []
-    _dds_channel_names: List[str] = []
+    _rx_channel_names: List[str]
+    _tx_channel_names: List[str]
+    _tx_control_channel_names: List[str]
+    _rx_coarse_ddc_channel_names: List[str]
+    _tx_coarse_duc_channel_names: List[str]
+    _rx_fine_ddc_channel_names: List[str]
+    _tx_fine_duc_channel_names: List[str]
+    _dds_channel_names: List[str]
     _device_name = ""
 
-    _path_map: Dict[str, Dict[str, Dict[str, List[str]]]] = {}
+    _path_map: Dict[str, Dict[str, Dict[str, List[str]]]]
 
     def __init__(self, uri="", phy_dev_name=""):
 
@@ -109,6 +109,8 @@ class ad9081_mc(ad9081):
         self._rx_fine_ddc_channel_names: List[str] = []
         self._tx_fine_duc_channel_names: List[str] = []
         self._dds_channel_names: List[str] = []
+        self._channel_cache = {}
+        self._attr_cache = {}
 
         context_manager.__init__(self, uri, self._device_name)
 
@@ -124,6 +126,7 @@ class ad9081_mc(ad9081):
         self._ctrl = self._ctx.find_device(phy_dev_name)
         if not self._ctrl:
             raise Exception("phy_dev_name not found with name: {}".format(phy_dev_name))
+        self._v0i_rx = self._find_channel("voltage0_i", False)
 
         # Find device with buffers
         self._txdac = _find_dev_with_buffers(self._ctx, True, "axi-ad9081")
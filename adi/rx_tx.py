@@ -254,6 +254,43 @@ class rx_core(rx_tx_common, metaclass=ABCMeta):
             )
         return data
 
+    def rx_into(self, out):
+        """Receive raw data from hardware buffers into a preallocated array
+        instead of allocating new arrays for every capture.
+
+        parameters:
+            out: type=numpy.array
+                Array with one row of rx_buffer_size samples per enabled
+                channel, of shape (len(rx_enabled_channels), rx_buffer_size).
+                For complex data devices out may instead be a real array of
+                shape (2 * len(rx_enabled_channels), rx_buffer_size), holding
+                I and Q of each channel in consecutive rows.
+
+        returns: type=numpy.array
+            out, filled with one buffer of samples per enabled channel.
+        """
+        if self._rx_unbuffered_data or self._rx_output_type != "raw":
+            raise Exception("rx_into only supports raw buffered data")
+        rows = len(self.rx_enabled_channels)
+        if self._complex_data and not np.iscomplexobj(out):
+            rows *= 2
+        if out.ndim != 2 or out.shape[0] != rows:
+            raise Exception(
+                "rx_into expects an array with {} rows, got shape {}".format(
+                    rows, out.shape
+                )
+            )
+        x = self._rx_buffered_data()
+        x = x if isinstance(x, list) else [x]
+        if self._complex_data and np.iscomplexobj(out):
+            for i in range(len(x) // 2):
+                out[i].real = x[i * 2]
+                out[i].imag = x[i * 2 + 1]
+        else:
+            for i, d in enumerate(x):
+                out[i] = d
+        return out
+
     @abstractmethod
     def _rx_init_channels(self):
         """Initialize RX channels"""
@@ -25,6 +25,7 @@ Rx6_cal = 0
 Rx7_cal = 0
 Rx8_cal = 0
 
+beam_settle_time = 0.25  # seconds to wait after steering the beam before capturing. Lower it if your setup settles faster
 refresh_time = 100  # refresh time in ms.  Auto beam sweep will update at this rate.  Too fast makes it hard to adjust the GUI values when sweeping is active
 d = 0.014  # element to element spacing of the antenna
 use_tx = False  # Enable TX path if True (if false, HB100 source)
@@ -46,7 +46,6 @@ import sys
 import time
 from time import sleep
 
-import matplotlib.pyplot as plt
 import numpy as np
 from adi import ad9361
 from adi.cn0566 import CN0566
@@ -57,7 +56,6 @@ from phaser_functions import (
     load_hb100_cal,
     phase_calibration,
 )
-from scipy import signal
 
 try:
     import config_custom as config  # this has all the key parameters that the user would want to change (i.e. calibration phase and antenna element spacing)
@@ -108,6 +106,19 @@ def do_cal_phase():
     plt.show()
 
 
+def grab_background(event):
+    fig = event.canvas.figure
+    backgrounds[fig] = event.canvas.copy_from_bbox(fig.bbox)
+
+
+def blit(fig, artists):
+    fig.canvas.restore_region(backgrounds[fig])
+    for artist in artists:
+        fig.draw_artist(artist)
+    fig.canvas.blit(fig.bbox)
+    fig.canvas.flush_events()
+
+
 # First try to connect to a locally connected CN0566. On success, connect,
 # on failure, connect to remote CN0566
 
@@ -159,21 +170,15 @@ except:
     print("And using TX path. Make sure antenna is connected.")
     config.use_tx = True  # Assume no HB100, use TX path.
 
-#  Configure SDR parameters.
-
-my_sdr.filter = "LTE20_MHz.ftr"  # Load LTE 20 MHz filter
-
+#  Configure SDR parameters. SDR_init() already loaded the LTE 20 MHz filter,
+#  attenuated TX1 and set tx_lo to config.Tx_freq, so only changes are written.
 
 # use_tx = config.use_tx
 use_tx = True
 
 if use_tx is True:
     # To use tx path, set chan1 gain "high" keep chan0 attenuated.
-    my_sdr.tx_hardwaregain_chan0 = int(
-        -88
-    )  # this is a negative number between 0 and -88
     my_sdr.tx_hardwaregain_chan1 = int(-3)
-    my_sdr.tx_lo = config.Tx_freq  # int(2.2e9)
 
     my_sdr.dds_single_tone(
         int(2e6), 0.9, 1
@@ -231,6 +236,10 @@ my_phaser.set_beam_phase_diff(0.0)
 # Really basic options - "plot" to plot continuously, "cal" to calibrate both gain and phase.
 func = sys.argv[1] if len(sys.argv) >= 2 else "plot"
 
+# matplotlib takes a while to import and is only needed to show results
+if func in ("plot", "cal"):
+    import matplotlib.pyplot as plt
+
 
 if func == "cal":
     input(
@@ -252,48 +261,89 @@ if func == "plot":
 else:
     do_plot = False
 
+if do_plot:
+    # PSD window, work buffer and frequency axis are fixed for the whole run.
+    # With the mean removal in the loop this matches
+    # signal.periodogram(x, 30000000, "blackman", scaling="spectrum")
+    psd_len = my_sdr.rx_buffer_size - 2
+    # Periodic Blackman window, prescaled so that |fft|**2 is the spectrum
+    psd_win = np.blackman(psd_len + 1)[:-1]
+    psd_win = (psd_win / psd_win.sum()).astype(np.float32)
+    psd_buf = np.empty((2, psd_len), dtype=np.complex64)
+    f = np.fft.fftfreq(psd_len, 1 / 30000000)
+
+    # The beam change is latched by the time set_beam_phase_diff() returns and
+    # the stale capture is dropped in the loop, so only RF settling remains.
+    # The default keeps the original 250 ms wait; tune it in config.py.
+    beam_settle_time = getattr(config, "beam_settle_time", 0.25)
+
+    # Captures land in one reused int16 array as the ADC delivers them, with
+    # rows ch0 I, ch0 Q, ch1 I, ch1 Q. Only the PSD widens them, to complex64.
+    stage = np.empty((4, my_sdr.rx_buffer_size), dtype=np.int16)
+
+    # Figures and artists are created once. Each frame only updates their data
+    # and blits them over a cached background instead of redrawing the figures.
+    plt.ion()
+    backgrounds = {}
+
+    fig1, ax1 = plt.subplots(num=1)
+    time_lines = [
+        ax1.plot(np.zeros(my_sdr.rx_buffer_size), color=c, animated=True)[0]
+        for c in ["red", "blue", "green", "black"]
+    ]
+    ax1.set_xlim(0, my_sdr.rx_buffer_size - 1)
+    ax1.set_ylim(-(2 ** 11), 2 ** 11)  # Pluto is a 12 bit ADC
+    ax1.set_xlabel("data point")
+    ax1.set_ylabel("output code")
+
+    fig2, ax2 = plt.subplots(num=2)
+    psd_lines = ax2.semilogy(f, np.ones((psd_len, 2)), animated=True)
+    ax2.set_xlim(f.min(), f.max())
+    ax2.set_ylim([1e-5, 1e6])
+    ax2.set_xlabel("frequency [Hz]")
+    ax2.set_ylabel("PSD [V**2/Hz]")
+
+    fig3, ax3 = plt.subplots(num=3)
+    gain_points = ax3.scatter([], [], s=10, animated=True)
+    delta_points = ax3.scatter([], [], s=10, animated=True)
+    ax3.set_xlim(-90, 90)
+    ax3.set_ylim(-80, 0)  # dBFS
+
+    for fig in (fig1, fig2, fig3):
+        fig.canvas.mpl_connect("draw_event", grab_background)
+        fig.canvas.draw()
+    plt.show(block=False)
+
 while do_plot == True:
     try:
         start = time.time()
         my_phaser.set_beam_phase_diff(0.0)
-        time.sleep(0.25)
-        data = my_sdr.rx()
-        data = my_sdr.rx()
-        ch0 = data[0]
-        ch1 = data[1]
-        f, Pxx_den0 = signal.periodogram(
-            ch0[1:-1], 30000000, "blackman", scaling="spectrum"
-        )
-        f, Pxx_den1 = signal.periodogram(
-            ch1[1:-1], 30000000, "blackman", scaling="spectrum"
-        )
-
-        plt.figure(1)
-        plt.clf()
-        plt.plot(np.real(ch0), color="red")
-        plt.plot(np.imag(ch0), color="blue")
-        plt.plot(np.real(ch1), color="green")
-        plt.plot(np.imag(ch1), color="black")
-        np.real
-        plt.xlabel("data point")
-        plt.ylabel("output code")
-        plt.draw()
-
-        plt.figure(2)
-        plt.clf()
-        plt.semilogy(f, Pxx_den0)
-        plt.semilogy(f, Pxx_den1)
-        plt.ylim([1e-5, 1e6])
-        plt.xlabel("frequency [Hz]")
-        plt.ylabel("PSD [V**2/Hz]")
-        plt.draw()
+        time.sleep(beam_settle_time)
+        # The first capture was queued before the beam change, so it is read
+        # and overwritten by the second
+        my_sdr.rx_into(stage)
+        my_sdr.rx_into(stage)
+        ch0_i, ch0_q, ch1_i, ch1_q = stage
+        psd_buf.real = stage[0::2, 1:-1]
+        psd_buf.imag = stage[1::2, 1:-1]
+        psd_buf -= psd_buf.mean(axis=1, keepdims=True)
+        psd_buf *= psd_win
+        Pxx = np.abs(np.fft.fft(psd_buf, axis=1))
+        Pxx **= 2
+
+        time_lines[0].set_ydata(ch0_i)
+        time_lines[1].set_ydata(ch0_q)
+        time_lines[2].set_ydata(ch1_i)
+        time_lines[3].set_ydata(ch1_q)
+        blit(fig1, time_lines)
+
+        psd_lines[0].set_ydata(Pxx[0])
+        psd_lines[1].set_ydata(Pxx[1])
+        blit(fig2, psd_lines)
 
         # Plot the output based on experiment that you are performing
         print("Plotting...")
 
-        plt.figure(3)
-        plt.ion()
-        #    plt.show()
         (
             gain,
             angle,
@@ -306,13 +356,10 @@ while do_plot == True:
         ) = calculate_plot(my_phaser)
         print("Sweeping took this many seconds: " + str(time.time() - start))
         #    gain,  = my_phaser.plot(plot_type="monopulse")
-        plt.clf()
-        plt.scatter(angle, gain, s=10)
-        plt.scatter(angle, delta, s=10)
-        plt.show()
+        gain_points.set_offsets(np.c_[angle, gain])
+        delta_points.set_offsets(np.c_[angle, delta])
+        blit(fig3, [gain_points, delta_points])
 
-        plt.pause(0.05)
-        time.sleep(0.05)
         print("Total took this many seconds: " + str(time.time() - start))
     except KeyboardInterrupt:
         do_plot = False
@@ -220,8 +220,6 @@ while attempts < max_attempts and not success:
         my_sdr.filter = (
             os.getcwd() + "/LTE20_MHz.ftr"
         )  # MWT: Using this for now, may not be necessary.
-        rx_buffer_size = int(4 * 256)
-        my_sdr.rx_buffer_size = rx_buffer_size
 
         my_sdr.tx_cyclic_buffer = True
         my_sdr.tx_buffer_size = int(2 ** 16)
@@ -87,6 +87,11 @@ def test_dma_rx(request):
     yield dma_rx
 
 
+@pytest.fixture()
+def test_dma_rx_into(request):
+    yield dma_rx_into
+
+
 @pytest.fixture()
 def test_dma_tx(request):
     yield dma_tx
@@ -84,6 +84,66 @@ def dma_rx(
     del sdr
 
 
+def dma_rx_into(uri, classname, channel, buffer_size=2 ** 15):
+    """dma_rx_into: Capture RX buffers into preallocated arrays with rx_into
+    and verify data is non-zero. For complex data devices both a complex
+    array and a real int16 array with I and Q rows are filled. Captures of
+    SI or unbuffered data and arrays with the wrong row count must raise.
+
+    parameters:
+        uri: type=string
+            URI of IIO context of target board/system
+        classname: type=string
+            Name of pyadi interface class which contain attribute
+        channel: type=list
+            List of integers or list of list of integers of channels to
+            enable through rx_enabled_channels
+        buffer_size: type=int
+            Size of RX buffer in samples. Defaults to 2**15
+    """
+    sdr = eval(classname + "(uri='" + uri + "')")
+    sdr.rx_enabled_channels = channel if isinstance(channel, list) else [channel]
+    sdr.rx_buffer_size = buffer_size
+    n = len(sdr.rx_enabled_channels)
+    try:
+        if sdr._complex_data:
+            out = np.zeros((n, buffer_size), dtype=np.complex128)
+            assert sdr.rx_into(out) is out
+            for chan in out:
+                assert np.max(np.abs(chan)) > 0, "Buffer all zeros"
+
+            out = np.zeros((2 * n, buffer_size), dtype=np.int16)
+            assert sdr.rx_into(out) is out
+            for chan in out:
+                assert np.max(np.abs(chan)) > 0, "Buffer all zeros"
+
+            with pytest.raises(Exception, match="rows"):
+                sdr.rx_into(np.zeros((n, buffer_size), dtype=np.int16))
+        else:
+            out = np.zeros((n, buffer_size), dtype=sdr._rx_data_type)
+            assert sdr.rx_into(out) is out
+            for chan in out:
+                assert np.max(np.abs(chan)) > 0, "Buffer all zeros"
+
+        with pytest.raises(Exception, match="rows"):
+            sdr.rx_into(np.zeros((n + 1, buffer_size), dtype=np.complex128))
+
+        sdr.rx_output_type = "SI"
+        with pytest.raises(Exception, match="raw buffered data"):
+            sdr.rx_into(out)
+        sdr.rx_output_type = "raw"
+
+        sdr._rx_unbuffered_data = True
+        with pytest.raises(Exception, match="raw buffered data"):
+            sdr.rx_into(out)
+        sdr._rx_unbuffered_data = False
+    except Exception as e:
+        del sdr
+        raise Exception(e) from e
+
+    del sdr
+
+
 def dma_tx(uri, classname, channel, use_tx2=False):
     """dma_tx: Construct TX buffers and verify no errors occur when pushed.
     Buffer is of size 2**15 and 10 buffers are pushed
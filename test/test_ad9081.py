@@ -112,6 +112,17 @@ def test_ad9081_rx_data(test_dma_rx, iio_uri, classname, channel):
     test_dma_rx(iio_uri, classname, channel)
 
 
+#########################################
+@pytest.mark.iio_hardware(hardware, True)
+@pytest.mark.parametrize("classname", [(classname)])
+@pytest.mark.parametrize("channel", [0, [0, 1]])
+def test_ad9081_rx_into(test_dma_rx_into, iio_uri, classname, channel):
+    channels = channel if isinstance(channel, list) else [channel]
+    if not all(is_channel(c, iio_uri) for c in channels):
+        pytest.skip("Skipping test: Channel " + str(channel) + "not available.")
+    test_dma_rx_into(iio_uri, classname, channel)
+
+
 #########################################
 @pytest.mark.iio_hardware(hardware)
 @pytest.mark.parametrize("classname", [(classname)])
@@ -346,3 +357,18 @@ def test_ad9081_nco_loopback(
 
 
 #########################################
+@pytest.mark.iio_hardware(hardware)
+@pytest.mark.parametrize("test_mode", ["pn9", "pn23", "off"])
+def test_ad9081_rx_voltage0_snapshot(iio_uri, test_mode):
+    import adi
+
+    dev = adi.ad9081(uri=iio_uri)
+    dev.rx_test_mode = test_mode
+    try:
+        snapshot = dev.rx_voltage0_snapshot()
+        assert snapshot["adc_frequency"] == dev.adc_frequency
+        assert snapshot["sampling_frequency"] == dev.rx_sample_rate
+        assert snapshot["test_mode"] == test_mode
+        assert snapshot["test_mode"] == dev.rx_test_mode
+    finally:
+        dev.rx_test_mode = "off"